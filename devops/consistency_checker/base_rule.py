@@ -7,6 +7,7 @@ It provides a consistent API for rule development, execution, and integration.
 """
 
 import abc
+import os
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
@@ -14,6 +15,9 @@ from pathlib import Path
 from typing import Dict, List, Any, Optional, Union, Set
 import uuid
 
+# Directories never descended into when walking the repository
+SKIP_DIRS = frozenset({'venv', '.venv', '__pycache__', '.git', 'node_modules'})
+
 
 class Severity(Enum):
     """Violation severity levels"""
@@ -202,6 +206,14 @@ class BaseRule(abc.ABC):
                 return True
         return False
     
+    def find_python_files(self, repo_root: Path) -> List[Path]:
+        """Walk the repository for Python files, pruning SKIP_DIRS before descent"""
+        python_files = []
+        for root, dirs, files in os.walk(repo_root):
+            dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
+            python_files.extend(Path(root, f) for f in files if f.endswith('.py'))
+        return python_files
+    
     def create_violation(
         self,
         file_path: Path,
@@ -169,11 +169,8 @@ class CodeComplexity(BaseRule):
     
     def _discover_files(self, repo_root: Path) -> List[Path]:
         """Discover Python files to check, skipping venv directory"""
-        files = []
-        for pattern in self.get_file_patterns():
-            files.extend(repo_root.glob(pattern))
-        # Explicitly skip any file under venv
-        return [f for f in files if f.is_file() and "venv" not in f.parts and self.should_check_file(f, repo_root)]
+        # Walk with venv and friends pruned; should_check_file applies the file patterns
+        return [f for f in self.find_python_files(repo_root) if self.should_check_file(f, repo_root)]
     
     def _check_file(self, file_path: Path, repo_root: Path) -> tuple[List[Violation], List[Violation], int]:
         """Check complexity in a single file"""
@@ -110,12 +110,8 @@ class NamingConventionsRule(BaseRule):
         if files:
             # Filter to only Python files, skip venv
             return [f for f in files if f.suffix == '.py' and "venv" not in f.parts and self._should_check_file(f)]
-        # Discover all Python files in the repository, skip venv
-        python_files = []
-        for py_file in repo_root.rglob("*.py"):
-            if "venv" not in py_file.parts and self._should_check_file(py_file):
-                python_files.append(py_file)
-        return python_files
+        # Discover all Python files in the repository, pruning venv and friends
+        return [f for f in self.find_python_files(repo_root) if self._should_check_file(f)]
     
     def _should_check_file(self, file_path: Path) -> bool:
         """Check if a file should be analyzed, ignoring venv directory"""
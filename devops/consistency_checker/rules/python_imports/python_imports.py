@@ -60,8 +60,8 @@ class PythonImportsRule(BaseRule):
         """Check Python files for import convention violations, skipping venv directory"""
         violations = []
         if files is None:
-            # Find all Python files in the repository, skip venv
-            python_files = [f for f in repo_root.rglob("*.py") if "venv" not in f.parts]
+            # Find all Python files in the repository, pruning venv and friends
+            python_files = self.find_python_files(repo_root)
         else:
             python_files = [f for f in files if f.suffix == ".py" and "venv" not in f.parts]
         for file_path in python_files:
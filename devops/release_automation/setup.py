@@ -40,6 +40,46 @@ from rich.box import ROUNDED
 # Initialize Rich console for cross-platform output formatting
 console = Console()
 
+# Static markup shown by print_banner() and at the end of setup
+_BANNER_TEXT = """
+    [bold blue]Git Helper Environment Initializer[/bold blue]
+
+    Welcome to the Git Helper development environment!
+    
+    This tool will configure your personal development environment for Git Helper.
+    It works with GitHub repositories and adapts to your current setup.
+
+    Features:
+    • Auto-detects your Git configuration and GitHub repository
+    • Sets up quality assurance hooks and checks  
+    • Creates personalized workflow configurations
+    • Enables seamless integration with Git Helper tools
+
+    @copyright 2025 Intel Corporation
+    Author: [bold green]pyCTH Team[/bold green]
+
+    [yellow]Let's get your environment ready for development![/yellow]
+    """
+
+_NEXT_STEPS = """
+[bold cyan]Setup Complete![/bold cyan]
+
+[green]✓ Git Helper configured for this repository[/green]
+[green]✓ User command symlinks created in ~/.local/bin[/green]
+[green]✓ Git hooks installed (pre-commit, pre-push)[/green]
+[green]✓ Available commands: git_helper, consistency_checker[/green]
+
+[yellow]Quick Start:[/yellow]
+• Run: [bold]git_helper --help[/bold]
+• Check code: [bold]consistency_checker --help[/bold]
+• Config: [bold].git_helper_config.json[/bold] for settings
+• Note: Commands available from any directory (via ~/.local/bin symlinks)
+    """
+
+# Step status labels for the setup summary table
+_STATUS_OK = Text("✓ Success", style="green")
+_STATUS_SKIPPED = Text("⚠ Skipped/Failed", style="yellow")
+
 # Configure Typer CLI application with basic settings for maximum compatibility
 app = typer.Typer(
     name="git-helper-setup",
@@ -110,28 +150,9 @@ def print_banner():
     that introduces users to the setup process and provides context about
     what the tool does.
     """
-    banner_text = """
-    [bold blue]Git Helper Environment Initializer[/bold blue]
-
-    Welcome to the Git Helper development environment!
-    
-    This tool will configure your personal development environment for Git Helper.
-    It works with GitHub repositories and adapts to your current setup.
-
-    Features:
-    • Auto-detects your Git configuration and GitHub repository
-    • Sets up quality assurance hooks and checks  
-    • Creates personalized workflow configurations
-    • Enables seamless integration with Git Helper tools
-
-    @copyright 2025 Intel Corporation
-    Author: [bold green]pyCTH Team[/bold green]
-
-    [yellow]Let's get your environment ready for development![/yellow]
-    """
     
     banner = Panel(
-        Text.from_markup(banner_text),
+        Text.from_markup(_BANNER_TEXT),
         border_style="blue",
         title="[bold cyan]Welcome[/bold cyan]",
         subtitle="[cyan]v1.0.0[/cyan]"
@@ -753,6 +774,23 @@ def create_user_symlinks() -> bool:
         return False
 
 
+def _print_setup_summary(step_results: Dict[str, bool]):
+    """Print the per-step results as a table, or as plain lines when not on a terminal."""
+    if console.is_terminal:
+        summary_table = Table(title="Setup Results")
+        summary_table.add_column("Step", style="cyan")
+        summary_table.add_column("Status", style="green")
+        
+        for step_name, result in step_results.items():
+            summary_table.add_row(step_name, _STATUS_OK if result else _STATUS_SKIPPED)
+        
+        console.print(summary_table)
+    else:
+        # Piped/CI output: plain lines, no table layout or markup parsing
+        for step_name, result in step_results.items():
+            console.print(f"{step_name}: {'OK' if result else 'SKIP/FAIL'}", markup=False, highlight=False)
+
+
 @app.command(name="setup")
 def setup():
     """
@@ -815,17 +853,7 @@ def setup():
     # Display setup summary table
     console.print("\n[bold cyan]Setup Summary[/bold cyan]")
     
-    summary_table = Table(title="Setup Results")
-    summary_table.add_column("Step", style="cyan")
-    summary_table.add_column("Status", style="green")
-    
-    for step_name, result in step_results.items():
-        summary_table.add_row(
-            step_name,
-            "[green]✓ Success[/green]" if result else "[yellow]⚠ Skipped/Failed[/yellow]"
-        )
-    
-    console.print(summary_table)
+    _print_setup_summary(step_results)
     
     # Provide final status and instructions
     if all(step_results.values()):
@@ -834,20 +862,7 @@ def setup():
         console.print("\n[yellow]⚠ Setup completed with some steps skipped or failed[/yellow]")
     
     # Display next steps for the user
-    console.print("""
-[bold cyan]Setup Complete![/bold cyan]
-
-[green]✓ Git Helper configured for this repository[/green]
-[green]✓ User command symlinks created in ~/.local/bin[/green]
-[green]✓ Git hooks installed (pre-commit, pre-push)[/green]
-[green]✓ Available commands: git_helper, consistency_checker[/green]
-
-[yellow]Quick Start:[/yellow]
-• Run: [bold]git_helper --help[/bold]
-• Check code: [bold]consistency_checker --help[/bold]
-• Config: [bold].git_helper_config.json[/bold] for settings
-• Note: Commands available from any directory (via ~/.local/bin symlinks)
-    """)
+    console.print(_NEXT_STEPS)
 
 
 @app.command(name="install-hooks")
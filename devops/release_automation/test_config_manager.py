@@ -12,28 +12,108 @@ Usage:
 """
 
 
+import functools
+import os
+import stat
+import tempfile
 import yaml
+from collections import defaultdict
 from pathlib import Path
-from typing import Dict, Any, Annotated, Optional, List
-from datetime import datetime
+from typing import Dict, Any, Annotated, Iterator, Optional, Tuple
 
 import typer
-from rich.console import Console
+from rich.console import Console, Group
 from rich.panel import Panel
 from rich.table import Table
 from rich.text import Text
-from rich.tree import Tree
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
-from rich.syntax import Syntax
-from rich.prompt import Confirm, Prompt, IntPrompt, FloatPrompt
-from rich.columns import Columns
-from rich.layout import Layout
-from rich import print as rprint
+
+# Prefer the libyaml-backed parser/emitter when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _Loader, CSafeDumper as _Dumper
+except ImportError:
+    from yaml import SafeLoader as _Loader, SafeDumper as _Dumper
 
 
 # Initialize Rich console
 console = Console()
 
+# Reusable formatter for the per-row weight column
+_WEIGHT_FMT = "{}%".format
+
+# Threshold keys expected under global_config
+_THRESHOLD_KEYS = ("auto_merge_threshold", "manual_review_threshold", "block_threshold")
+
+# JSON schema for .github/pr-test-config.yml; cross-field rules live in _iter_semantic_findings
+_CONFIG_SCHEMA = {
+    "type": "object",
+    "required": ["global_config", "test_suite"],
+    "properties": {
+        "global_config": {
+            "type": "object",
+            "required": list(_THRESHOLD_KEYS),
+            "properties": {
+                "auto_merge_threshold": {"$ref": "#/$defs/percentage"},
+                "manual_review_threshold": {"$ref": "#/$defs/percentage"},
+                "block_threshold": {"$ref": "#/$defs/percentage"},
+            },
+        },
+        "test_suite": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "required": ["name", "weight"],
+                "properties": {
+                    "name": {"type": "string", "minLength": 1},
+                    "weight": {"$ref": "#/$defs/percentage"},
+                    "required": {"type": "boolean"},
+                },
+            },
+        },
+    },
+    "$defs": {
+        "percentage": {"type": "number", "minimum": 0, "maximum": 100},
+    },
+}
+
+
+@functools.lru_cache(maxsize=1)
+def _get_validator():
+    """Build the config schema validator once; compiling it is the expensive part."""
+    import jsonschema
+    return jsonschema.Draft202012Validator(_CONFIG_SCHEMA)
+
+
+@functools.lru_cache(maxsize=8)
+def _find_repo_root_cached(cwd: Path) -> Optional[Path]:
+    """Walk up from cwd to the directory holding .git; None if there is none."""
+    current = cwd
+    while current != current.parent:
+        # exists() rather than isdir(): worktrees and submodules use a .git file
+        if os.path.exists(os.path.join(current, '.git')):
+            return current
+        current = current.parent
+    return None
+
+
+def _is_number(value: Any) -> bool:
+    """True for int/float values, excluding bools."""
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _coerce_int(value: Any) -> Any:
+    """Turn decimal-digit strings into ints; leave every other value untouched."""
+    # isdecimal(), not isdigit(): int() rejects superscripts like "²"
+    if isinstance(value, str) and value.strip().isdecimal():
+        return int(value)
+    return value
+
+
+def _weight_of(test: Dict[str, Any]) -> float:
+    """Numeric weight of a test entry, treating missing or invalid weights as 0."""
+    weight = test.get('weight') if isinstance(test, dict) else None
+    return weight if _is_number(weight) else 0
+
+
 # Typer app
 app = typer.Typer(
     name="test-config-manager",
@@ -80,17 +160,61 @@ class TestConfigManager:
             config_path = str(repo_root / ".github" / "pr-test-config.yml")
         
         self.config_path = Path(config_path)
+        # Loaded values with the wrong shape; set by _finalize_config, checked before saving
+        self._mistyped_document = None
+        self._mistyped_sections = {}
         self.config = self._load_config()
+        self._finalize_config()
+    
+    def _finalize_config(self):
+        """Ensure the top-level sections exist so callers can index them directly."""
+        if not isinstance(self.config, dict):
+            # An empty file loads as None and simply starts fresh
+            if self.config is not None:
+                self._mistyped_document = self.config
+            self.config = {}
+        # A bare "test_suite:" key loads as None; treat it like an empty section.
+        # Other mistyped sections get read-only stand-ins so validate can still report them.
+        for key, section_type in (("global_config", dict), ("test_suite", list)):
+            section = self.config.get(key)
+            if not isinstance(section, section_type):
+                if section is not None:
+                    self._mistyped_sections[key] = section
+                self.config[key] = section_type()
+    
+        # Normalize quoted numbers (e.g. weight: "15") in one pass so the
+        # schema's number checks and the weight sums see real ints
+        global_config = self.config["global_config"]
+        for key in _THRESHOLD_KEYS:
+            if key in global_config:
+                global_config[key] = _coerce_int(global_config[key])
+        for test in self.config["test_suite"]:
+            if isinstance(test, dict) and 'weight' in test:
+                test['weight'] = _coerce_int(test['weight'])
+        
+        self._total_weight = sum(_weight_of(test) for test in self.config["test_suite"])
+    
+    def _as_loaded(self) -> Any:
+        """The configuration as loaded, with mistyped values in place of their stand-ins."""
+        if self._mistyped_document is not None:
+            return self._mistyped_document
+        return {**self.config, **self._mistyped_sections}
+    
+    def _index(self) -> Dict[str, int]:
+        """Map each test name to its position in test_suite (first occurrence wins)."""
+        index = {}
+        for i, test in enumerate(self.config["test_suite"]):
+            if isinstance(test, dict):
+                index.setdefault(test.get('name'), i)
+        return index
     
     def _find_repo_root(self) -> Path:
         """Find the Git repository root"""
-        current = Path.cwd()
-        while current != current.parent:
-            if (current / '.git').exists():
-                return current
-            current = current.parent
-        console.print("[red]Error: Not in a Git repository[/red]")
-        raise typer.Exit(1)
+        repo_root = _find_repo_root_cached(Path.cwd())
+        if repo_root is None:
+            console.print("[red]Error: Not in a Git repository[/red]")
+            raise typer.Exit(1)
+        return repo_root
     
     def _load_config(self) -> Dict[str, Any]:
         """Load configuration from YAML file."""
@@ -100,10 +224,9 @@ class TestConfigManager:
             return self._create_default_config()
         
         try:
-            with open(self.config_path, 'r') as f:
-                config = yaml.safe_load(f)
-                console.print(f"[green]Loaded configuration from {self.config_path}[/green]")
-                return config
+            config = yaml.load(self.config_path.read_bytes(), Loader=_Loader)
+            console.print(f"[green]Loaded configuration from {self.config_path}[/green]")
+            return config
         except yaml.YAMLError as e:
             console.print(f"[red]Invalid YAML in configuration file: {e}[/red]")
             raise typer.Exit(1)
@@ -170,17 +293,50 @@ class TestConfigManager:
     
     def _save_config_data(self, config_data: Dict[str, Any]):
         """Save given configuration data to YAML file."""
+        # Writing now would replace the user's mistyped sections with empty stand-ins
+        if self._mistyped_document is not None or self._mistyped_sections:
+            console.print(f"[red]Error: {self.config_path} does not have the expected structure; "
+                          f"not overwriting it (run 'validate' for details)[/red]")
+            raise typer.Exit(1)
+        
         self.config_path.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(self.config_path, 'w') as f:
-            yaml.dump(config_data, f, default_flow_style=False, sort_keys=False)
+        data = yaml.dump(config_data, Dumper=_Dumper, encoding='utf-8',
+                         default_flow_style=False, sort_keys=False)
+        
+        # Replace the symlink target, not the link, and keep the file's permissions
+        target = self.config_path.resolve()
+        try:
+            mode = stat.S_IMODE(os.stat(target).st_mode)
+        except FileNotFoundError:
+            umask = os.umask(0)
+            os.umask(umask)
+            mode = 0o666 & ~umask
+        
+        # Write to a unique sibling temp file and rename so readers never see a partial config
+        tmp_path = None
+        try:
+            with tempfile.NamedTemporaryFile(dir=target.parent, prefix=f".{target.name}.",
+                                             suffix='.tmp', delete=False) as f:
+                tmp_path = Path(f.name)
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            # chmod by path after closing: os.fchmod is Unix-only before Python 3.13
+            os.chmod(tmp_path, mode)
+            os.replace(tmp_path, target)
+        except OSError:
+            if tmp_path is not None:
+                tmp_path.unlink(missing_ok=True)
+            raise
         
         console.print(f"[green]Configuration saved to {self.config_path}[/green]")
     
     def list_tests(self, show_details: bool = False):
         """List all configured tests."""
-        tests = self.config.get("test_suite", [])
-        global_config = self.config.get("global_config", {})
+        # Malformed entries are left for validate to report
+        tests = [test for test in self.config["test_suite"] if isinstance(test, dict)]
+        global_config = self.config["global_config"]
         
         # Show global configuration
         global_panel = Panel(
@@ -192,10 +348,9 @@ class TestConfigManager:
             title="[bold cyan]Global Configuration[/bold cyan]",
             border_style="cyan"
         )
-        console.print(global_panel)
         
         if not tests:
-            console.print("[yellow]No tests configured[/yellow]")
+            console.print(Group(global_panel, Text.from_markup("[yellow]No tests configured[/yellow]")))
             return
         
         # Create a detailed table
@@ -209,54 +364,52 @@ class TestConfigManager:
         if show_details:
             table.add_column("Action Path", style="dim")
         
-        # Group tests by category
-        categories = {}
-        total_weight = 0
+        # Group tests by category, building each row's cells in the same pass
+        categories = defaultdict(list)
         
         for test in tests:
-            category = test.get('category', 'other')
-            if category not in categories:
-                categories[category] = []
-            categories[category].append(test)
-            total_weight += test.get('weight', 0)
+            name = test.get('name', 'unknown')
+            cells = [
+                name,
+                test.get('display_name', name),
+                _WEIGHT_FMT(test.get('weight', 0)),
+                "Yes" if test.get('required', False) else "No",
+            ]
+            
+            if show_details:
+                cells.append(test.get('action_path', 'Not specified'))
+            
+            categories[test.get('category', 'other')].append(cells)
         
         # Add tests to table, grouped by category
-        for category, category_tests in sorted(categories.items()):
-            for i, test in enumerate(category_tests):
-                name = test.get('name', 'unknown')
-                display_name = test.get('display_name', name)
-                weight = test.get('weight', 0)
-                required = "Yes" if test.get('required', False) else "No"
-                category_name = category.replace('_', ' ').title()
-                
-                row = [name, display_name, f"{weight}%", required, category_name]
-                
-                if show_details:
-                    action_path = test.get('action_path', 'Not specified')
-                    row.append(action_path)
-                
-                table.add_row(*row)
-        
-        console.print(table)
+        for category, rows in sorted(categories.items()):
+            # Category label is the same for every row in the group
+            category_name = category.replace('_', ' ').title()
+            
+            for name, display_name, weight, required, *details in rows:
+                table.add_row(name, display_name, weight, required, category_name, *details)
         
         # Show summary
         summary = Panel(
             f"[bold]Total tests:[/bold] {len(tests)}\n"
-            f"[bold]Total weight:[/bold] {total_weight}%\n"
+            f"[bold]Total weight:[/bold] {self._total_weight}%\n"
             f"[bold]Categories:[/bold] {len(categories)}",
             title="[bold green]Summary[/bold green]",
             border_style="green"
         )
-        console.print(summary)
+        
+        # Render all three sections in one print call
+        console.print(Group(global_panel, table, summary))
     
     def add_test(self, name: str, display_name: str, weight: int, 
                  action_path: str, required: bool = False, category: str = "other"):
         """Add a new test to the configuration."""
-        tests = self.config.get("test_suite", [])
+        from rich.prompt import Confirm
+        
+        tests = self.config["test_suite"]
         
         # Check if test already exists
-        existing_test = next((test for test in tests if test.get('name') == name), None)
-        if existing_test:
+        if name in self._index():
             console.print(f"[red]Test '{name}' already exists[/red]")
             
             if Confirm.ask("[yellow]Do you want to update the existing test?[/yellow]"):
@@ -264,7 +417,7 @@ class TestConfigManager:
             return
         
         # Validate weight
-        current_total = sum(test.get('weight', 0) for test in tests)
+        current_total = self._total_weight
         if current_total + weight > 100:
             console.print(f"[red]Total weight would exceed 100% (current: {current_total}%, adding: {weight}%)[/red]")
             
@@ -282,7 +435,7 @@ class TestConfigManager:
         }
         
         tests.append(new_test)
-        self.config["test_suite"] = tests
+        self._total_weight += _weight_of(new_test)
         self._save_config()
         
         console.print(f"[green]Added test '{name}' successfully[/green]")
@@ -293,15 +446,10 @@ class TestConfigManager:
     def update_test(self, name: str, display_name: str = None, weight: int = None,
                    action_path: str = None, required: bool = None, category: str = None):
         """Update an existing test."""
-        tests = self.config.get("test_suite", [])
+        tests = self.config["test_suite"]
         
         # Find the test
-        test_index = None
-        for i, test in enumerate(tests):
-            if test.get('name') == name:
-                test_index = i
-                break
-        
+        test_index = self._index().get(name)
         if test_index is None:
             console.print(f"[red]Test '{name}' not found[/red]")
             return
@@ -313,6 +461,7 @@ class TestConfigManager:
         if display_name is not None:
             test['display_name'] = display_name
         if weight is not None:
+            self._total_weight += weight - _weight_of(test)
             test['weight'] = weight
         if action_path is not None:
             test['action_path'] = action_path
@@ -321,7 +470,11 @@ class TestConfigManager:
         if category is not None:
             test['category'] = category
         
-        self.config["test_suite"] = tests
+        # Nothing to write when every option was omitted or matched the current value
+        if test == old_test:
+            console.print(f"[yellow]No changes for test '{name}'; configuration not rewritten[/yellow]")
+            return
+        
         self._save_config()
         
         console.print(f"[green]Updated test '{name}' successfully[/green]")
@@ -343,20 +496,17 @@ class TestConfigManager:
     
     def remove_test(self, name: str):
         """Remove a test from the configuration."""
-        tests = self.config.get("test_suite", [])
+        tests = self.config["test_suite"]
         
         # Find and remove the test
-        test_to_remove = None
-        for i, test in enumerate(tests):
-            if test.get('name') == name:
-                test_to_remove = tests.pop(i)
-                break
-        
-        if test_to_remove is None:
+        test_index = self._index().get(name)
+        if test_index is None:
             console.print(f"[red]Test '{name}' not found[/red]")
             return
         
-        self.config["test_suite"] = tests
+        test_to_remove = tests.pop(test_index)
+        self._total_weight -= _weight_of(test_to_remove)
+        
         self._save_config()
         
         console.print(f"[green]Removed test '{name}' successfully[/green]")
@@ -364,85 +514,100 @@ class TestConfigManager:
     
     def _show_test_details(self, test: Dict[str, Any], title: str = "Test Details"):
         """Show details of a single test."""
-        details = Text.from_markup(
-            f"[bold]Name:[/bold] {test.get('name', 'unknown')}\n"
-            f"[bold]Display Name:[/bold] {test.get('display_name', 'N/A')}\n"
-            f"[bold]Weight:[/bold] {test.get('weight', 0)}%\n"
-            f"[bold]Required:[/bold] {'Yes' if test.get('required', False) else 'No'}\n"
-            f"[bold]Category:[/bold] {test.get('category', 'other')}\n"
-            f"[bold]Action Path:[/bold] {test.get('action_path', 'N/A')}"
-        )
+        # Styling lives on the columns; cells are plain Text so no markup is parsed
+        details = Table(show_header=False, box=None, padding=(0, 1, 0, 0))
+        details.add_column("Field", style="bold")
+        details.add_column("Value")
+        
+        for field, value in (
+            ("Name:", test.get('name', 'unknown')),
+            ("Display Name:", test.get('display_name', 'N/A')),
+            ("Weight:", _WEIGHT_FMT(test.get('weight', 0))),
+            ("Required:", 'Yes' if test.get('required', False) else 'No'),
+            ("Category:", test.get('category', 'other')),
+            ("Action Path:", test.get('action_path', 'N/A')),
+        ):
+            details.add_row(Text(field), Text(str(value)))
         
         panel = Panel(details, title=f"[bold cyan]{title}[/bold cyan]", border_style="cyan")
         console.print(panel)
     
-    def validate_config(self):
-        """Validate the configuration for common issues."""
-        tests = self.config.get("test_suite", [])
-        global_config = self.config.get("global_config", {})
-        
-        issues = []
-        warnings = []
-        
-        # Check global config
-        thresholds = {
-            'auto_merge_threshold': global_config.get('auto_merge_threshold'),
-            'manual_review_threshold': global_config.get('manual_review_threshold'),
-            'block_threshold': global_config.get('block_threshold')
-        }
-        
-        for name, value in thresholds.items():
-            if value is None:
-                issues.append(f"Missing {name} in global configuration")
-            elif not isinstance(value, (int, float)) or value < 0 or value > 100:
-                issues.append(f"Invalid {name}: {value} (must be 0-100)")
+    def _iter_semantic_findings(self) -> Iterator[Tuple[bool, str]]:
+        """Yield (is_issue, message) for the cross-field rules the schema cannot express."""
+        tests = self.config["test_suite"]
+        global_config = self.config["global_config"]
         
         # Check threshold logic
-        auto_merge = thresholds.get('auto_merge_threshold', 0)
-        manual_review = thresholds.get('manual_review_threshold', 0)
-        block = thresholds.get('block_threshold', 0)
+        auto_merge = global_config.get('auto_merge_threshold')
+        manual_review = global_config.get('manual_review_threshold')
+        block = global_config.get('block_threshold')
         
-        if auto_merge <= manual_review:
-            issues.append(f"Auto-merge threshold ({auto_merge}) should be higher than manual review threshold ({manual_review})")
+        if _is_number(auto_merge) and _is_number(manual_review) and auto_merge <= manual_review:
+            yield True, f"Auto-merge threshold ({auto_merge}) should be higher than manual review threshold ({manual_review})"
         
-        if manual_review <= block:
-            warnings.append(f"Manual review threshold ({manual_review}) should be higher than block threshold ({block})")
+        if _is_number(manual_review) and _is_number(block) and manual_review <= block:
+            yield False, f"Manual review threshold ({manual_review}) should be higher than block threshold ({block})"
         
         # Check tests
         if not tests:
-            warnings.append("No tests configured")
-        else:
-            total_weight = 0
-            names = set()
+            yield False, "No tests configured"
+            return
+        
+        total_weight = 0
+        names = set()
+        
+        for test in tests:
+            # Malformed entries are reported by the schema
+            if not isinstance(test, dict):
+                continue
             
-            for i, test in enumerate(tests):
-                test_name = test.get('name')
-                if not test_name:
-                    issues.append(f"Test {i} missing name")
-                elif test_name in names:
-                    issues.append(f"Duplicate test name: {test_name}")
-                else:
-                    names.add(test_name)
-                
-                weight = test.get('weight')
-                if weight is None:
-                    issues.append(f"Test '{test_name}' missing weight")
-                elif not isinstance(weight, (int, float)) or weight < 0:
-                    issues.append(f"Test '{test_name}' has invalid weight: {weight}")
-                else:
-                    total_weight += weight
-                
-                if not test.get('display_name'):
-                    warnings.append(f"Test '{test_name}' missing display name")
-                
-                if not test.get('action_path'):
-                    warnings.append(f"Test '{test_name}' missing action path")
+            # Read every field once up front
+            get = test.get
+            test_name = get('name')
+            weight = get('weight')
+            display_name = get('display_name')
+            action_path = get('action_path')
             
-            if total_weight != 100:
-                if total_weight > 100:
-                    issues.append(f"Total weight exceeds 100%: {total_weight}%")
-                else:
-                    warnings.append(f"Total weight is less than 100%: {total_weight}%")
+            if test_name in names:
+                yield True, f"Duplicate test name: {test_name}"
+            elif test_name:
+                names.add(test_name)
+            
+            if _is_number(weight):
+                total_weight += weight
+            
+            if not display_name:
+                yield False, f"Test '{test_name}' missing display name"
+            
+            if not action_path:
+                yield False, f"Test '{test_name}' missing action path"
+        
+        if total_weight > 100:
+            yield True, f"Total weight exceeds 100%: {total_weight}%"
+        elif total_weight < 100:
+            yield False, f"Total weight is less than 100%: {total_weight}%"
+    
+    def validate_config(self, quick: bool = False) -> bool:
+        """Validate the configuration for common issues.
+        
+        With quick=True, stop at the first issue and return the result without
+        collecting warnings or printing anything.
+        """
+        # Validate the sections as loaded, not the empty stand-ins _finalize_config used
+        instance = self._as_loaded()
+        
+        if quick:
+            if next(_get_validator().iter_errors(instance), None) is not None:
+                return False
+            return not any(is_issue for is_issue, _ in self._iter_semantic_findings())
+        
+        # Structural checks (required keys, types, 0-100 ranges) come from the schema
+        issues = [f"{error.json_path}: {error.message}"
+                  for error in _get_validator().iter_errors(instance)]
+        warnings = []
+        
+        for is_issue, message in self._iter_semantic_findings():
+            (issues if is_issue else warnings).append(message)
         
         # Display results
         if not issues and not warnings:
@@ -453,9 +618,11 @@ class TestConfigManager:
             ))
         else:
             # Create validation results
+            panels = []
+            
             if issues:
                 issues_text = "\n".join(f"• {issue}" for issue in issues)
-                console.print(Panel(
+                panels.append(Panel(
                     issues_text,
                     title="[bold red]Issues Found[/bold red]",
                     border_style="red"
@@ -463,17 +630,21 @@ class TestConfigManager:
             
             if warnings:
                 warnings_text = "\n".join(f"• {warning}" for warning in warnings)
-                console.print(Panel(
+                panels.append(Panel(
                     warnings_text,
                     title="[bold yellow]Warnings[/bold yellow]",
                     border_style="yellow"
                 ))
+            
+            console.print(Group(*panels))
         
         return len(issues) == 0
     
     def show_config(self):
         """Show the full configuration with syntax highlighting."""
-        config_yaml = yaml.dump(self.config, default_flow_style=False, sort_keys=False)
+        from rich.syntax import Syntax
+        
+        config_yaml = yaml.dump(self._as_loaded(), Dumper=_Dumper, default_flow_style=False, sort_keys=False)
         
         syntax = Syntax(config_yaml, "yaml", theme="monokai", line_numbers=True)
         
@@ -486,8 +657,10 @@ class TestConfigManager:
         console.print(panel)
 
 
-# Initialize the manager
-manager = TestConfigManager()
+@functools.lru_cache(maxsize=1)
+def get_manager() -> TestConfigManager:
+    """Create the manager on first use so --help and the bare callback skip config loading."""
+    return TestConfigManager()
 
 
 @app.command(name="list")
@@ -495,7 +668,7 @@ def list_tests(
     details: Annotated[bool, typer.Option("--details", "-d", help="Show detailed information including action paths")] = False,
 ):
     """List all configured tests"""
-    manager.list_tests(show_details=details)
+    get_manager().list_tests(show_details=details)
 
 
 @app.command(name="add")
@@ -511,7 +684,7 @@ def add_test(
     if not action_path:
         action_path = f".github/actions/{name.replace('_', '-')}"
     
-    manager.add_test(name, display_name, weight, action_path, required, category)
+    get_manager().add_test(name, display_name, weight, action_path, required, category)
 
 
 @app.command(name="update")
@@ -524,7 +697,7 @@ def update_test(
     category: Annotated[Optional[str], typer.Option("--category", "-c", help="New category")] = None,
 ):
     """Update an existing test"""
-    manager.update_test(name, display_name, weight, action_path, required, category)
+    get_manager().update_test(name, display_name, weight, action_path, required, category)
 
 
 @app.command(name="remove")
@@ -534,17 +707,19 @@ def remove_test(
 ):
     """Remove a test from the configuration"""
     if not force:
+        from rich.prompt import Confirm
+        
         if not Confirm.ask(f"[yellow]Are you sure you want to remove test '{name}'?[/yellow]"):
             console.print("[blue]Operation cancelled[/blue]")
             return
     
-    manager.remove_test(name)
+    get_manager().remove_test(name)
 
 
 @app.command(name="validate")
 def validate():
     """Validate the configuration for common issues"""
-    is_valid = manager.validate_config()
+    is_valid = get_manager().validate_config()
     
     if not is_valid:
         raise typer.Exit(1)
@@ -553,7 +728,7 @@ def validate():
 @app.command(name="show")
 def show_config():
     """Show the full configuration file with syntax highlighting"""
-    manager.show_config()
+    get_manager().show_config()
 
 
 @app.command(name="set-thresholds")
@@ -563,7 +738,9 @@ def set_thresholds(
     block: Annotated[Optional[int], typer.Option("--block", "-b", help="Block threshold (0-100)")] = None,
 ):
     """Set global thresholds for test scoring"""
-    global_config = manager.config.get("global_config", {})
+    manager = get_manager()
+    global_config = manager.config["global_config"]
+    previous = dict(global_config)
     
     if auto_merge is not None:
         global_config["auto_merge_threshold"] = auto_merge
@@ -572,10 +749,11 @@ def set_thresholds(
     if block is not None:
         global_config["block_threshold"] = block
     
-    manager.config["global_config"] = global_config
-    manager._save_config()
-    
-    console.print("[green]Global thresholds updated successfully[/green]")
+    if global_config != previous:
+        manager._save_config()
+        console.print("[green]Global thresholds updated successfully[/green]")
+    else:
+        console.print("[yellow]Thresholds unchanged; configuration not rewritten[/yellow]")
     
     # Show current thresholds
     threshold_table = Table(title="Updated Thresholds")
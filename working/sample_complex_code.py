@@ -19,6 +19,8 @@ from typing import Dict, List, Optional, Any
 class ComplexProcessor:
     """A class with too many methods to demonstrate class complexity checks."""
     
+    __slots__ = ('data', 'config')
+    
     def __init__(self):
         self.data = {}
         self.config = {}